@@ -25,6 +25,8 @@ Usage example:
 
 from __future__ import annotations
 
+import array
+import bisect
 from collections.abc import Iterable, Iterator
 import itertools
 import time
@@ -45,6 +47,61 @@ class DocumentRepeatError(exceptions.LangExtractError):
   """Exception raised when identical document ids are present."""
 
 
+class _IntervalIndex:
+  """Sorted index of character intervals for fast overlap queries.
+
+  Overlapping spans are coalesced on insert, so the stored spans are pairwise
+  disjoint and sorted by both start and end position. An overlap query only
+  needs to inspect the closest span that starts before the query ends, which
+  makes lookups O(log n) instead of a scan over every merged extraction.
+  Zero-length intervals are kept separately since they only overlap intervals
+  that strictly contain them.
+
+  Positions are stored as parallel integer arrays rather than per-span
+  objects, which keeps the index compact and lets bisect compare plain ints.
+  """
+
+  def __init__(self):
+    self._starts = array.array("q")
+    self._ends = array.array("q")
+    self._points = array.array("q")
+
+  def overlaps(self, start: int, end: int) -> bool:
+    """Returns True if [start, end) overlaps any indexed interval."""
+    idx = bisect.bisect_left(self._starts, end)
+    if idx > 0 and self._ends[idx - 1] > start:
+      return True
+    idx = bisect.bisect_right(self._points, start)
+    return idx < len(self._points) and self._points[idx] < end
+
+  def add(self, start: int, end: int) -> None:
+    """Adds [start, end) to the index."""
+    if start == end:
+      self._points.insert(bisect.bisect_left(self._points, start), start)
+      return
+    starts, ends = self._starts, self._ends
+    lo = bisect.bisect_left(starts, start)
+    if lo > 0 and ends[lo - 1] > start:
+      lo -= 1
+    hi = bisect.bisect_left(starts, end, lo)
+    if lo < hi:
+      start = min(start, starts[lo])
+      end = max(end, ends[hi - 1])
+    starts[lo:hi] = array.array("q", (start,))
+    ends[lo:hi] = array.array("q", (end,))
+
+
+def _char_span(extraction: data.Extraction) -> tuple[int, int] | None:
+  """Returns (start_pos, end_pos) of an extraction, or None if unaligned."""
+  char_interval = extraction.char_interval
+  if char_interval is None:
+    return None
+  start, end = char_interval.start_pos, char_interval.end_pos
+  if start is None or end is None:
+    return None
+  return start, end
+
+
 def _merge_non_overlapping_extractions(
     all_extractions: list[Iterable[data.Extraction]],
 ) -> list[data.Extraction]:
@@ -70,18 +127,36 @@ def _merge_non_overlapping_extractions(
 
   merged_extractions = list(all_extractions[0])
 
+  # Inverted spans (start > end) cannot be coalesced into the index, so they
+  # fall back to pairwise _extractions_overlap checks to keep its semantics.
+  index = _IntervalIndex()
+  inverted: list[data.Extraction] = []
+  for extraction in merged_extractions:
+    span = _char_span(extraction)
+    if span is None:
+      continue
+    if span[0] > span[1]:
+      inverted.append(extraction)
+    else:
+      index.add(*span)
+
   for pass_extractions in all_extractions[1:]:
     for extraction in pass_extractions:
-      overlaps = False
-      if extraction.char_interval is not None:
-        for existing_extraction in merged_extractions:
-          if existing_extraction.char_interval is not None:
-            if _extractions_overlap(extraction, existing_extraction):
-              overlaps = True
-              break
-
-      if not overlaps:
+      span = _char_span(extraction)
+      if span is None:
+        merged_extractions.append(extraction)
+      elif span[0] > span[1]:
+        if not any(
+            _extractions_overlap(extraction, existing)
+            for existing in merged_extractions
+        ):
+          merged_extractions.append(extraction)
+          inverted.append(extraction)
+      elif not index.overlaps(*span) and not any(
+          _extractions_overlap(extraction, existing) for existing in inverted
+      ):
         merged_extractions.append(extraction)
+        index.add(*span)
 
   return merged_extractions
 
@@ -298,22 +373,26 @@ class Annotator:
     )
 
     chars_processed = 0
+    # Examples are the same for every chunk; format them once per call.
+    examples_section = self._prompt_generator.format_examples_section()
 
     for index, batch in enumerate(progress_bar):
       logging.info("Processing batch %d with length %d", index, len(batch))
 
       batch_prompts: list[str] = []
+      batch_size = 0
       for text_chunk in batch:
+        batch_size += len(text_chunk.chunk_text)
         batch_prompts.append(
             self._prompt_generator.render(
                 question=text_chunk.chunk_text,
                 additional_context=text_chunk.additional_context,
+                examples_section=examples_section,
             )
         )
 
       # Show what we're currently processing
       if debug and progress_bar:
-        batch_size = sum(len(chunk.chunk_text) for chunk in batch)
         desc = progress.format_extraction_progress(
             model_info,
             current_chars=batch_size,
@@ -335,7 +414,6 @@ class Annotator:
 
         # Update progress bar with final processed count
         if progress_bar:
-          batch_size = sum(len(chunk.chunk_text) for chunk in batch)
           desc = progress.format_extraction_progress(
               model_info,
               current_chars=batch_size,
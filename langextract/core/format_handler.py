@@ -38,6 +38,11 @@ _FENCE_NEWLINE = r"(?:\s*\n)?"
 _FENCE_BODY = r"(?P<body>[\s\S]*?)"
 _FENCE_END = r"```"
 
+_VALID_LANGUAGE_TAGS = {
+    data.FormatType.YAML: frozenset({_YAML_FORMAT, _YML_FORMAT}),
+    data.FormatType.JSON: frozenset({_JSON_FORMAT}),
+}
+
 _FENCE_RE = re.compile(
     _FENCE_START + _LANGUAGE_TAG + _FENCE_NEWLINE + _FENCE_BODY + _FENCE_END,
     re.MULTILINE,
@@ -249,14 +254,13 @@ class FormatHandler:
     fence_type = self.format_type.value
     return f"```{fence_type}\n{content.strip()}\n```"
 
-  def _is_valid_language_tag(
-      self, lang: str | None, valid_tags: dict[data.FormatType, set[str]]
-  ) -> bool:
+  def _is_valid_language_tag(self, lang: str | None) -> bool:
     """Check if language tag is valid for the format type."""
     if lang is None:
       return True
-    tag = lang.strip().lower()
-    return tag in valid_tags.get(self.format_type, set())
+    return lang.strip().lower() in _VALID_LANGUAGE_TAGS.get(
+        self.format_type, frozenset()
+    )
 
   def _extract_content(self, text: str) -> str:
     """Extract content from text, handling fences if configured.
@@ -276,15 +280,8 @@ class FormatHandler:
 
     matches = list(_FENCE_RE.finditer(text))
 
-    valid_tags = {
-        data.FormatType.YAML: {_YAML_FORMAT, _YML_FORMAT},
-        data.FormatType.JSON: {_JSON_FORMAT},
-    }
-
     candidates = [
-        m
-        for m in matches
-        if self._is_valid_language_tag(m.group("lang"), valid_tags)
+        m for m in matches if self._is_valid_language_tag(m.group("lang"))
     ]
 
     if self.strict_fences:
@@ -49,6 +49,13 @@ class ModelConfig:
   )
 
 
+# Environment variables checked, in order, for an API key per model family.
+_API_KEY_ENV_VARS_BY_PROVIDER: typing.Final[dict[str, tuple[str, ...]]] = {
+    "gemini": ("GEMINI_API_KEY", "LANGEXTRACT_API_KEY"),
+    "gpt": ("OPENAI_API_KEY", "LANGEXTRACT_API_KEY"),
+}
+
+
 def _kwargs_with_environment_defaults(
     model_id: str, kwargs: dict[str, typing.Any]
 ) -> dict[str, typing.Any]:
@@ -62,15 +69,10 @@ def _kwargs_with_environment_defaults(
     Updated kwargs with environment defaults.
   """
   resolved = dict(kwargs)
+  model_lower = model_id.lower()
 
   if "api_key" not in resolved:
-    model_lower = model_id.lower()
-    env_vars_by_provider = {
-        "gemini": ("GEMINI_API_KEY", "LANGEXTRACT_API_KEY"),
-        "gpt": ("OPENAI_API_KEY", "LANGEXTRACT_API_KEY"),
-    }
-
-    for provider_prefix, env_vars in env_vars_by_provider.items():
+    for provider_prefix, env_vars in _API_KEY_ENV_VARS_BY_PROVIDER.items():
       if provider_prefix in model_lower:
         for env_var in env_vars:
           api_key = os.getenv(env_var)
@@ -79,7 +81,7 @@ def _kwargs_with_environment_defaults(
             break
         break
 
-  if "ollama" in model_id.lower() and "base_url" not in resolved:
+  if "ollama" in model_lower and "base_url" not in resolved:
     resolved["base_url"] = os.getenv(
         "OLLAMA_BASE_URL", "http://localhost:11434"
     )
@@ -123,7 +123,9 @@ def save_annotated_documents(
         continue
 
       doc_dict = data_lib.annotated_document_to_dict(adoc)
-      f.write(json.dumps(doc_dict, ensure_ascii=False) + '\n')
+      # Separate writes avoid copying each serialized record to append '\n'.
+      f.write(json.dumps(doc_dict, ensure_ascii=False))
+      f.write('\n')
       has_data = True
       doc_count += 1
       progress_bar.update(1)
@@ -171,9 +173,11 @@ def load_annotated_documents_jsonl(
 
   with open(jsonl_path, 'r', encoding='utf-8') as f:
     for line in f:
-      line_bytes = len(line.encode('utf-8'))
-      bytes_read += line_bytes
-      progress_bar.update(line_bytes)
+      # Track progress from the underlying byte offset instead of re-encoding
+      # each line; the offset advances per buffered read, not per line.
+      position = f.buffer.tell()
+      progress_bar.update(position - bytes_read)
+      bytes_read = position
 
       line = line.strip()
       if not line:
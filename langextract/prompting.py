@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import json
 import pathlib
 
@@ -48,6 +49,12 @@ class PromptTemplateStructured:
   examples: list[data.ExampleData] = dataclasses.field(default_factory=list)
 
 
+@functools.lru_cache(maxsize=None)
+def _prompt_template_adapter() -> pydantic.TypeAdapter:
+  """Returns the TypeAdapter for PromptTemplateStructured, built once."""
+  return pydantic.TypeAdapter(PromptTemplateStructured)
+
+
 def read_prompt_template_structured_from_file(
     prompt_path: str,
     format_type: data.FormatType = data.FormatType.YAML,
@@ -64,7 +71,7 @@ def read_prompt_template_structured_from_file(
   Raises:
     ParseError: If the file cannot be parsed successfully.
   """
-  adapter = pydantic.TypeAdapter(PromptTemplateStructured)
+  adapter = _prompt_template_adapter()
   try:
     with pathlib.Path(prompt_path).open("rt") as f:
       data_dict = {}
@@ -111,13 +118,34 @@ class QAPromptGenerator:
         f"{self.answer_prefix}{answer}\n",
     ])
 
-  def render(self, question: str, additional_context: str | None = None) -> str:
+  def format_examples_section(self) -> str:
+    """Formats the heading and all examples of the template.
+
+    Returns:
+      The examples section of the prompt, or an empty string if the template
+      has no examples.
+    """
+    if not self.template.examples:
+      return ""
+    return "\n".join([
+        self.examples_heading,
+        *(self.format_example_as_text(ex) for ex in self.template.examples),
+    ])
+
+  def render(
+      self,
+      question: str,
+      additional_context: str | None = None,
+      examples_section: str | None = None,
+  ) -> str:
     """Generate a text representation of the prompt.
 
     Args:
       question: That will be presented to the model.
       additional_context: Additional context to include in the prompt. An empty
         string is ignored.
+      examples_section: Output of format_examples_section() to reuse across
+        several renders. If None, the examples are formatted for this call.
 
     Returns:
       Text prompt with a question to be presented to a language model.
@@ -127,10 +155,10 @@ class QAPromptGenerator:
     if additional_context:
       prompt_lines.append(f"{additional_context}\n")
 
-    if self.template.examples:
-      prompt_lines.append(self.examples_heading)
-      for ex in self.template.examples:
-        prompt_lines.append(self.format_example_as_text(ex))
+    if examples_section is None:
+      examples_section = self.format_examples_section()
+    if examples_section:
+      prompt_lines.append(examples_section)
 
     prompt_lines.append(f"{self.question_prefix}{question}")
     prompt_lines.append(self.answer_prefix)
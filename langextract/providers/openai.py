@@ -19,7 +19,7 @@ from __future__ import annotations
 
 import concurrent.futures
 import dataclasses
-from typing import Any, Iterator, Sequence
+from typing import Any, Final, Iterator, Sequence
 
 from langextract.core import base_model
 from langextract.core import data
@@ -29,6 +29,16 @@ from langextract.core import types as core_types
 from langextract.providers import patterns
 from langextract.providers import router
 
+# System messages are identical for every prompt of a given output format.
+_SYSTEM_MESSAGES: Final[dict[data.FormatType, str]] = {
+    data.FormatType.JSON: (
+        'You are a helpful assistant that responds in JSON format.'
+    ),
+    data.FormatType.YAML: (
+        'You are a helpful assistant that responds in YAML format.'
+    ),
+}
+
 
 @router.register(
     *patterns.OPENAI_PATTERNS,
@@ -137,17 +147,8 @@ class OpenAILanguageModel(base_model.BaseLanguageModel):
     try:
       normalized_config = self._normalize_reasoning_params(config)
 
-      system_message = ''
-      if self.format_type == data.FormatType.JSON:
-        system_message = (
-            'You are a helpful assistant that responds in JSON format.'
-        )
-      elif self.format_type == data.FormatType.YAML:
-        system_message = (
-            'You are a helpful assistant that responds in YAML format.'
-        )
-
       messages = [{'role': 'user', 'content': prompt}]
+      system_message = _SYSTEM_MESSAGES.get(self.format_type)
       if system_message:
         messages.insert(0, {'role': 'system', 'content': system_message})
 
@@ -27,6 +27,7 @@ import difflib
 import functools
 import itertools
 import operator
+import sys
 from typing import Final
 
 from absl import logging
@@ -463,6 +464,9 @@ class Resolver(AbstractResolver):
           attributes_key = extraction_class + attributes_suffix
           attributes = group.get(attributes_key, None)
 
+        # Classes repeat across groups and documents; intern string labels.
+        if isinstance(extraction_class, str):
+          extraction_class = sys.intern(extraction_class)
         processed_extractions.append(
             data.Extraction(
                 extraction_class=extraction_class,
@@ -702,7 +706,8 @@ class WordAligner:
       logging.info("No extraction groups provided; returning empty list.")
       return []
 
-    source_tokens = list(_tokenize_with_lowercase(source_text))
+    tokenized_text = tokenizer.tokenize(source_text)
+    source_tokens = list(_lowercase_tokens(tokenized_text))
 
     delim_len = len(list(_tokenize_with_lowercase(delim)))
     if delim_len != 1:
@@ -720,6 +725,7 @@ class WordAligner:
     self._set_seqs(source_tokens, extraction_tokens)
 
     index_to_extraction_group = {}
+    token_len_by_index: dict[int, int] = {}
     extraction_index = 0
     for group_index, group in enumerate(extraction_groups):
       logging.debug(
@@ -737,15 +743,15 @@ class WordAligner:
           )
 
         index_to_extraction_group[extraction_index] = (extraction, group_index)
-        extraction_text_tokens = list(
-            _tokenize_with_lowercase(extraction.extraction_text)
+        extraction_text_len = sum(
+            1 for _ in _tokenize_with_lowercase(extraction.extraction_text)
         )
-        extraction_index += len(extraction_text_tokens) + delim_len
+        token_len_by_index[extraction_index] = extraction_text_len
+        extraction_index += extraction_text_len + delim_len
 
     aligned_extraction_groups: list[list[data.Extraction]] = [
         [] for _ in extraction_groups
     ]
-    tokenized_text = tokenizer.tokenize(source_text)
 
     # Track which extractions were aligned in the exact matching phase
     aligned_extractions = []
@@ -782,9 +788,7 @@ class WordAligner:
             f" tokens {tokenized_text.tokens}."
         ) from e
 
-      extraction_text_len = len(
-          list(_tokenize_with_lowercase(extraction.extraction_text))
-      )
+      extraction_text_len = token_len_by_index[j]
       if extraction_text_len < n:
         raise ValueError(
             "Delimiter prevents blocks greater than extraction length: "
@@ -807,10 +811,12 @@ class WordAligner:
           extraction.alignment_status = None
 
     # Collect unaligned extractions
-    unaligned_extractions = []
-    for extraction, _ in index_to_extraction_group.values():
-      if extraction not in aligned_extractions:
-        unaligned_extractions.append(extraction)
+    aligned_ids = {id(extraction) for extraction in aligned_extractions}
+    unaligned_extractions = [
+        extraction
+        for extraction, _ in index_to_extraction_group.values()
+        if id(extraction) not in aligned_ids
+    ]
 
     # Apply fuzzy alignment to remaining extractions
     if enable_fuzzy_alignment and unaligned_extractions:
@@ -855,14 +861,25 @@ def _tokenize_with_lowercase(text: str) -> Iterator[str]:
   Yields:
     Iterator[str]: An iterator over tokenized words.
   """
-  tokenized_pb2 = tokenizer.tokenize(text)
-  original_text = tokenized_pb2.text
-  for token in tokenized_pb2.tokens:
+  yield from _lowercase_tokens(tokenizer.tokenize(text))
+
+
+def _lowercase_tokens(
+    tokenized_text: tokenizer.TokenizedText,
+) -> Iterator[str]:
+  """Yields the lowercased word of each token in already tokenized text.
+
+  Args:
+    tokenized_text: The tokenized text to read tokens from.
+
+  Yields:
+    Iterator[str]: An iterator over lowercased token strings.
+  """
+  original_text = tokenized_text.text
+  for token in tokenized_text.tokens:
     start = token.char_interval.start_pos
     end = token.char_interval.end_pos
-    token_str = original_text[start:end]
-    token_str = token_str.lower()
-    yield token_str
+    yield original_text[start:end].lower()
 
 
 @functools.lru_cache(maxsize=10000)
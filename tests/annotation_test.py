@@ -1046,6 +1046,109 @@ class MultiPassHelperFunctionsTest(parameterized.TestCase):
               "class3",
           ],  # class2 excluded due to overlap
       ),
+      dict(
+          testcase_name="overlapping_first_pass_spans",
+          all_extractions=[
+              [
+                  data.Extraction(
+                      "class1", "text1", char_interval=data.CharInterval(0, 10)
+                  ),
+                  data.Extraction(
+                      "class2", "text2", char_interval=data.CharInterval(5, 20)
+                  ),
+              ],
+              [
+                  data.Extraction(
+                      "class3", "text3", char_interval=data.CharInterval(12, 18)
+                  ),  # Overlaps class2 only
+                  data.Extraction(
+                      "class4", "text4", char_interval=data.CharInterval(20, 25)
+                  ),  # Adjacent, no overlap
+              ],
+          ],
+          expected_count=3,
+          expected_classes=["class1", "class2", "class4"],
+      ),
+      dict(
+          testcase_name="later_pass_overlaps_within_pass",
+          all_extractions=[
+              [
+                  data.Extraction(
+                      "class1", "text1", char_interval=data.CharInterval(0, 5)
+                  )
+              ],
+              [
+                  data.Extraction(
+                      "class2", "text2", char_interval=data.CharInterval(10, 20)
+                  ),
+                  data.Extraction(
+                      "class3", "text3", char_interval=data.CharInterval(15, 25)
+                  ),  # Overlaps class2 from the same pass
+              ],
+              [
+                  data.Extraction(
+                      "class4", "text4", char_interval=data.CharInterval(3, 12)
+                  ),  # Overlaps class1 and class2
+                  data.Extraction(
+                      "class5", "text5", char_interval=data.CharInterval(5, 10)
+                  ),  # Fills the gap exactly
+              ],
+          ],
+          expected_count=3,
+          expected_classes=["class1", "class2", "class5"],
+      ),
+      dict(
+          testcase_name="unaligned_extractions_kept",
+          all_extractions=[
+              [
+                  data.Extraction(
+                      "class1", "text1", char_interval=data.CharInterval(0, 10)
+                  )
+              ],
+              [
+                  data.Extraction("class2", "text2", char_interval=None),
+                  data.Extraction(
+                      "class3", "text3", char_interval=data.CharInterval()
+                  ),
+              ],
+          ],
+          expected_count=3,
+          expected_classes=["class1", "class2", "class3"],
+      ),
+      dict(
+          testcase_name="inverted_intervals_use_pairwise_overlap",
+          all_extractions=[
+              [
+                  data.Extraction(
+                      "class1", "text1", char_interval=data.CharInterval(0, 5)
+                  ),
+                  data.Extraction(
+                      "class2", "text2", char_interval=data.CharInterval(4, 10)
+                  ),
+                  data.Extraction(
+                      "class3", "text3", char_interval=data.CharInterval(20, 30)
+                  ),
+              ],
+              [
+                  data.Extraction(
+                      "class4", "text4", char_interval=data.CharInterval(7, 3)
+                  ),
+                  data.Extraction(
+                      "class5", "text5", char_interval=data.CharInterval(25, 22)
+                  ),
+                  data.Extraction(
+                      "class6", "text6", char_interval=data.CharInterval(42, 41)
+                  ),
+              ],
+              [
+                  data.Extraction(
+                      "class7", "text7", char_interval=data.CharInterval(40, 45)
+                  ),
+              ],
+          ],
+          expected_count=5,
+          expected_classes=["class1", "class2", "class3", "class4", "class6"],
+      ),
   )
   def test_merge_non_overlapping_extractions(
       self, all_extractions, expected_count, expected_classes
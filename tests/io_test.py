@@ -0,0 +1,97 @@
+# Copyright 2025 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for langextract.io module."""
+
+import pathlib
+import tempfile
+
+from absl.testing import absltest
+from absl.testing import parameterized
+
+from langextract import io
+from langextract.core import data
+
+
+def _sample_documents() -> list[data.AnnotatedDocument]:
+  return [
+      data.AnnotatedDocument(
+          document_id="doc_1",
+          text="Le patient a reçu 5 mg de morphine – 日本語テキスト ☕",
+          extractions=[
+              data.Extraction(
+                  extraction_class="médicament",
+                  extraction_text="morphine",
+                  char_interval=data.CharInterval(start_pos=26, end_pos=34),
+                  attributes={"note": "über"},
+              ),
+          ],
+      ),
+      data.AnnotatedDocument(
+          document_id="doc_2",
+          text="Plain ASCII text.",
+          extractions=[],
+      ),
+  ]
+
+
+class LoadAnnotatedDocumentsJsonlTest(parameterized.TestCase):
+
+  def _assert_documents_equal(self, expected, actual):
+    self.assertLen(actual, len(expected))
+    for want, got in zip(expected, actual):
+      self.assertEqual(want.document_id, got.document_id)
+      self.assertEqual(want.text, got.text)
+      self.assertEqual(want.extractions, got.extractions)
+
+  def test_round_trip_non_ascii(self):
+    output_dir = pathlib.Path(self.enter_context(tempfile.TemporaryDirectory()))
+    documents = _sample_documents()
+
+    io.save_annotated_documents(
+        iter(documents), output_dir=output_dir, show_progress=False
+    )
+    loaded = list(
+        io.load_annotated_documents_jsonl(
+            output_dir / "data.jsonl", show_progress=False
+        )
+    )
+
+    self._assert_documents_equal(documents, loaded)
+
+  @parameterized.named_parameters(
+      dict(testcase_name="crlf", line_ending="\r\n"),
+      dict(testcase_name="bare_cr", line_ending="\r"),
+      dict(testcase_name="trailing_nbsp", line_ending="\u00a0\n"),
+  )
+  def test_loads_alternate_line_endings(self, line_ending):
+    output_dir = pathlib.Path(self.enter_context(tempfile.TemporaryDirectory()))
+    documents = _sample_documents()
+    io.save_annotated_documents(
+        iter(documents), output_dir=output_dir, show_progress=False
+    )
+    jsonl_path = output_dir / "data.jsonl"
+    jsonl_path.write_bytes(
+        jsonl_path.read_bytes().replace(b"\n", line_ending.encode("utf-8"))
+    )
+
+    loaded = list(
+        io.load_annotated_documents_jsonl(jsonl_path, show_progress=False)
+    )
+
+    self._assert_documents_equal(documents, loaded)
+
+
+if __name__ == "__main__":
+  absltest.main()
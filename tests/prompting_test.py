@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import textwrap
+from unittest import mock
 
 from absl.testing import absltest
 from absl.testing import parameterized
@@ -398,6 +399,74 @@ class QAPromptGeneratorTest(parameterized.TestCase):
     )
     self.assertEqual(expected_formatted_example, actual_formatted_example)
 
+  def test_render_reuses_precomputed_examples_section(self):
+    """A precomputed examples section is used as is and matches render."""
+    template = prompting.PromptTemplateStructured(
+        description="Extract medications.",
+        examples=[
+            data.ExampleData(
+                text="Take aspirin daily.",
+                extractions=[
+                    data.Extraction(
+                        extraction_text="aspirin",
+                        extraction_class="medication",
+                    ),
+                ],
+            ),
+        ],
+    )
+    format_handler = fh.FormatHandler(format_type=data.FormatType.JSON)
+    prompt_generator = prompting.QAPromptGenerator(
+        template=template,
+        format_handler=format_handler,
+    )
+    examples_section = prompt_generator.format_examples_section()
+
+    with mock.patch.object(
+        format_handler,
+        "format_extraction_example",
+        wraps=format_handler.format_extraction_example,
+    ) as format_mock:
+      prompt = prompt_generator.render(
+          "First chunk.", examples_section=examples_section
+      )
+
+    format_mock.assert_not_called()
+    self.assertEqual(prompt_generator.render("First chunk."), prompt)
+
+  def test_render_reflects_examples_mutated_in_place(self):
+    """Examples mutated after a render are reflected in the next one."""
+    example = data.ExampleData(
+        text="Take aspirin daily.",
+        extractions=[
+            data.Extraction(
+                extraction_text="aspirin",
+                extraction_class="medication",
+            ),
+        ],
+    )
+    format_handler = fh.FormatHandler(format_type=data.FormatType.JSON)
+    prompt_generator = prompting.QAPromptGenerator(
+        template=prompting.PromptTemplateStructured(
+            description="Extract medications.", examples=[example]
+        ),
+        format_handler=format_handler,
+    )
+    prompt_generator.render("First chunk.")
+
+    example.text = "Give ibuprofen as needed."
+    example.extractions[0] = data.Extraction(
+        extraction_text="ibuprofen",
+        extraction_class="medication",
+    )
+    format_handler.format_type = data.FormatType.YAML
+    prompt = prompt_generator.render("Second chunk.")
+
+    self.assertNotIn("aspirin", prompt)
+    self.assertIn("Q: Give ibuprofen as needed.", prompt)
+    self.assertIn("```yaml", prompt)
+    self.assertNotIn("```json", prompt)
+
 
 if __name__ == "__main__":
   absltest.main()
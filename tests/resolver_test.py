@@ -21,6 +21,7 @@ from absl.testing import parameterized
 from langextract import chunking
 from langextract import resolver as resolver_lib
 from langextract.core import data
+from langextract.core import format_handler as fh
 from langextract.core import tokenizer
 
 
@@ -517,6 +518,21 @@ class ExtractOrderedEntitiesTest(parameterized.TestCase):
               ),
           ],
       ),
+      dict(
+          testcase_name="non_string_class_key",
+          resolver=resolver_lib.Resolver(
+              format_handler=fh.FormatHandler(attribute_suffix=None),
+          ),
+          test_input=[{1: "foo"}],
+          expected_output=[
+              data.Extraction(
+                  extraction_class=1,
+                  extraction_text="foo",
+                  extraction_index=1,
+                  group_index=0,
+              ),
+          ],
+      ),
   )
   def test_extract_ordered_extractions_success(
       self,